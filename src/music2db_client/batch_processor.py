@@ -1,9 +1,8 @@
 from pathlib import Path
 from typing import Dict, Any, List
-import requests
 from rich.progress import track
 from .logging_setup import get_logger
-from .main import extract_metadata, settings
+from .main import SESSION, _encode_tracks, _scandir_recursive, extract_metadata, settings
 
 log = get_logger(__name__)
 
@@ -19,16 +18,13 @@ def process_directory(directory: Path, batch_size: int = 100) -> None:
         log.error(f"Directory {directory} does not exist")
         return
         
-    extensions = set(settings.music.extensions)
+    extensions = frozenset(extension.lower() for extension in settings.music.extensions)
     tracks = []
-    
+
     log.info(f"Starting batch processing of directory: {directory}")
-    
+
     # Collect all music files
-    music_files = [
-        f for f in directory.rglob("*") 
-        if f.suffix.lower() in extensions and not f.is_symlink()
-    ]
+    music_files = [Path(entry.path) for entry in _scandir_recursive(directory, extensions)]
     
     if not music_files:
         log.info("No music files found")
@@ -60,7 +56,8 @@ def _send_batch(tracks: List[Dict[str, Any]]) -> None:
     """Send batch of tracks to server."""
     try:
         url = f"{settings.music_db.base_url}{settings.music_db.many_tracks_endpoint}"
-        response = requests.post(url, json=tracks)
+        body, headers = _encode_tracks(tracks)
+        response = SESSION.post(url, data=body, headers=headers)
         
         if response.status_code == 200:
             result = response.json()
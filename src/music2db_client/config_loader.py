@@ -24,6 +24,7 @@ def default_logging_config() -> dict[str, Any]:
         "show_level": False,
         "show_path": False,
         "logs_width": 140,
+        "buffer_capacity": 0,
         "tags_width": 16,
         "tag_filter_mode": "any",
         "unknown_tags": "hide",
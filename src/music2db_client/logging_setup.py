@@ -1,11 +1,36 @@
 from __future__ import annotations
 
+import atexit
 import logging
+from collections.abc import Callable
+from logging.handlers import MemoryHandler
 from typing import Any
 
 APP_NAME = "music2db-client"
 DEFAULT_TAG = "state"
 
+_reconfigure_hooks: list[Callable[[], None]] = []
+_memory_handlers: list[MemoryHandler] = []
+
+
+def flush_logs() -> None:
+    """Flush any buffered log records through to their target handlers."""
+    for handler in _memory_handlers:
+        handler.flush()
+
+
+atexit.register(flush_logs)
+
+
+def register_reconfigure_hook(hook: Callable[[], None]) -> None:
+    """Run ``hook`` now and again after every setup_logging call.
+
+    Lets modules cache logging-derived state (such as "is DEBUG enabled")
+    without it going stale when logging is reconfigured.
+    """
+    _reconfigure_hooks.append(hook)
+    hook()
+
 
 class DefaultTagFilter(logging.Filter):
     """Adds a default cyberlog tag to app logs that do not have one."""
@@ -30,6 +55,14 @@ def get_logger(name: str) -> logging.Logger:
 
 
 def setup_logging(config: dict[str, Any]) -> logging.Logger:
+    config = dict(config)
+    # Not part of the cyberlog config contract; handled locally below.
+    capacity = int(config.pop("buffer_capacity", 0) or 0)
+    # Drain buffers from any previous configuration before the handlers they
+    # target are detached; otherwise reconfiguring to capacity 0 would strand
+    # unflushed records until the atexit hook replays them out of order.
+    flush_logs()
+    _memory_handlers.clear()
     logger = logging.getLogger(APP_NAME)
     logger.handlers.clear()
     logger.filters.clear()
@@ -52,12 +85,31 @@ def setup_logging(config: dict[str, Any]) -> logging.Logger:
         logger.addHandler(handler)
         logger.setLevel(_level(config.get("level", "INFO")))
 
+    if capacity > 0:
+        _buffer_handlers(logger, capacity)
+
     logger.filters.clear()
     logger.addFilter(DefaultTagFilter())
     apply_external_logger_levels(config.get("loggers", {}))
+    for hook in _reconfigure_hooks:
+        hook()
     return logger
 
 
+def _buffer_handlers(logger: logging.Logger, capacity: int) -> None:
+    """Batch records through MemoryHandlers so N debug lines cost one write.
+
+    Errors and shutdown flush immediately; everything else is written once
+    the buffer fills.
+    """
+    buffered = []
+    for handler in logger.handlers:
+        memory_handler = MemoryHandler(capacity, flushLevel=logging.ERROR, target=handler)
+        _memory_handlers.append(memory_handler)
+        buffered.append(memory_handler)
+    logger.handlers = buffered
+
+
 def apply_external_logger_levels(loggers: dict[str, str]) -> None:
     for logger_name, level_name in loggers.items():
         logging.getLogger(logger_name).setLevel(_level(level_name))
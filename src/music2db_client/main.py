@@ -1,23 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
+from contextlib import closing
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote
 
+import orjson
 import requests
 import schedule
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from mutagen import File as MutagenFile  # type: ignore
 from pydantic import ValidationError
 
+try:
+    from tinytag import TinyTag  # type: ignore
+except ImportError:  # pragma: no cover - tinytag is a regular dependency
+    TinyTag = None
+
 from .config_loader import (
     get_active_config_files,
     load_logging_config,
@@ -29,16 +43,28 @@ from .config_loader import (
 from .logging_setup import get_logger, setup_logging
 from .settings import Settings
 from .signals import GracefulKiller
+from .watcher import MusicWatcher
 
 APP_NAME = "music2db-client"
 HOME_DIR = os.path.expanduser("~")
 
+# One pooled session for every server call, so batches reuse TCP connections
+# instead of paying a fresh handshake per request. Retries stay app-level in
+# _send_batch; the adapter only pools.
+SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
 load_dotenv()
 
 log = get_logger(__name__)
 settings: Settings
 
 
+_LASTFM_RE = re.compile(r"LastFM tags:\s*(.*)", re.DOTALL)
+
+
 @dataclass
 class FileSnapshot:
     path: Path
@@ -73,7 +99,62 @@ class SyncPlan:
 
 
 def extract_metadata(file_path: Path) -> dict[str, Any]:
-    """Extract contract-compatible metadata from a music file."""
+    """Extract contract-compatible metadata from a music file.
+
+    Uses tinytag for the hot read-only path (much faster than mutagen when
+    loading many files) and falls back to mutagen for formats tinytag does
+    not handle.
+    """
+    if TinyTag is not None and TinyTag.is_supported(str(file_path)):
+        return _extract_metadata_tinytag(file_path)
+    return _extract_metadata_mutagen(file_path)
+
+
+def _extract_metadata_tinytag(file_path: Path) -> dict[str, Any]:
+    tag = TinyTag.get(str(file_path))
+    metadata: dict[str, Any] = {
+        "artist": tag.artist,
+        "title": tag.title,
+        "album": tag.album,
+        "genre": tag.genre,
+        "year": tag.year,
+    }
+    if tag.duration:
+        metadata["length"] = int(tag.duration)
+
+    comment = tag.comment
+    match = _LASTFM_RE.search(comment) if isinstance(comment, str) else None
+    if match:
+        metadata["tags"] = match.group(1).strip()
+    elif os.path.splitext(str(file_path))[1].lower() == ".mp3":
+        # tinytag does not expose COMM frames by description; do a targeted
+        # ID3 read just for the LastFM tags comment.
+        tags = _lastfm_tags_from_id3(file_path)
+        if tags:
+            metadata["tags"] = tags
+
+    return sanitize_metadata(metadata)
+
+
+def _lastfm_tags_from_id3(file_path: Path) -> str | None:
+    try:
+        from mutagen.id3 import ID3  # type: ignore
+
+        tags = ID3(str(file_path))
+    except Exception:
+        return None
+    comm = {frame.desc: frame for frame in tags.getall("COMM")}.get("LastFM tags")
+    if comm is not None and comm.text:
+        return _strip_lastfm_prefix(str(comm.text[0]))
+    return None
+
+
+def _strip_lastfm_prefix(text: str) -> str:
+    match = _LASTFM_RE.search(text)
+    return match.group(1).strip() if match else text.strip()
+
+
+def _extract_metadata_mutagen(file_path: Path) -> dict[str, Any]:
     audio = MutagenFile(file_path)
     if audio is None:
         return {}
@@ -85,16 +166,26 @@ def extract_metadata(file_path: Path) -> dict[str, Any]:
 
     if tags:
         if hasattr(tags, "getall"):
-            metadata["artist"] = _join_id3_text(tags.getall("TPE1"))
-            metadata["title"] = _join_id3_text(tags.getall("TIT2"))
-            metadata["album"] = _join_id3_text(tags.getall("TALB"))
-            metadata["genre"] = _join_id3_text(tags.getall("TCON"))
-            metadata["year"] = _join_id3_text(tags.getall("TDRC"))
-
-            for comm in tags.getall("COMM"):
-                if comm.desc == "LastFM tags" and comm.text:
-                    metadata["tags"] = str(comm.text[0]).replace("LastFM tags:", "").strip()
-                    break
+            # One getall per field, inserting only non-None values, so
+            # sanitize_metadata has nothing to throw away.
+            def _first_text(frame_id: str) -> str | None:
+                values = [str(frame.text[0]) for frame in tags.getall(frame_id) if getattr(frame, "text", None)]
+                return " & ".join(values) if values else None
+
+            for key, frame_id in (
+                ("artist", "TPE1"),
+                ("title", "TIT2"),
+                ("album", "TALB"),
+                ("genre", "TCON"),
+                ("year", "TDRC"),
+            ):
+                value = _first_text(frame_id)
+                if value is not None:
+                    metadata[key] = value
+
+            comm = {frame.desc: frame for frame in tags.getall("COMM")}.get("LastFM tags")
+            if comm is not None and comm.text:
+                metadata["tags"] = _strip_lastfm_prefix(str(comm.text[0]))
         else:
             metadata["artist"] = _first_tag_value(tags, "artist")
             metadata["title"] = _first_tag_value(tags, "title")
@@ -103,8 +194,9 @@ def extract_metadata(file_path: Path) -> dict[str, Any]:
             metadata["year"] = _first_tag_value(tags, "date")
 
             comment = _first_tag_value(tags, "comment")
-            if isinstance(comment, str) and "LastFM tags:" in comment:
-                metadata["tags"] = comment.split("LastFM tags:", 1)[1].strip()
+            match = _LASTFM_RE.search(comment) if isinstance(comment, str) else None
+            if match:
+                metadata["tags"] = match.group(1).strip()
 
     return sanitize_metadata(metadata)
 
@@ -118,11 +210,27 @@ def sanitize_metadata(metadata: dict[str, Any]) -> dict[str, str | int | float |
     return cleaned
 
 
+# Successful requests confirm health for this long, so closely spaced scans
+# (watch mode, retries) skip the pre-flight /health/ round trip.
+_HEALTH_CACHE_SECONDS = 60
+_server_healthy_until = 0.0
+
+
+def _mark_server_healthy() -> None:
+    global _server_healthy_until
+    _server_healthy_until = time.monotonic() + _HEALTH_CACHE_SECONDS
+
+
+def _mark_server_unhealthy() -> None:
+    global _server_healthy_until
+    _server_healthy_until = 0.0
+
+
 def check_server_health() -> bool:
     """Check whether the server is ready for indexing."""
     url = f"{settings.music_db.base_url}/health/"
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         if response.status_code != 200:
             log.error("`http` Server health check failed with status code %s", response.status_code)
             return False
@@ -140,6 +248,7 @@ def check_server_health() -> bool:
 
         if data.get("embedding_model"):
             log.info("`http` Server embedding model: %s", data["embedding_model"])
+        _mark_server_healthy()
         return True
     except requests.exceptions.RequestException as exc:
         log.error("`http` Server health check failed: %s", exc)
@@ -160,7 +269,7 @@ def scan_music_directory(
     dry_run = settings.sync.dry_run if dry_run is None else dry_run
     delete_missing = settings.sync.delete_missing if delete_missing is None else delete_missing
 
-    if not check_server_health():
+    if time.monotonic() >= _server_healthy_until and not check_server_health():
         log.error("`scan` Server is not healthy, skipping scan")
         return False
 
@@ -200,8 +309,17 @@ def scan_music_directory(
         _log_dry_run_plan(plan)
         return True
 
+    def _record_sent_batch(batch: list[dict[str, Any]]) -> None:
+        records = {
+            track["file_path"]: plan.manifest.files[track["file_path"]]
+            for track in batch
+            if track["file_path"] in plan.manifest.files
+        }
+        if records:
+            _upsert_file_records(records)
+
     success = True
-    if plan.tracks_to_send and not _send_tracks_in_batches(plan.tracks_to_send):
+    if plan.tracks_to_send and not _send_tracks_in_batches(plan.tracks_to_send, on_batch_sent=_record_sent_batch):
         success = False
 
     if plan.paths_to_delete and not _delete_tracks(plan.paths_to_delete):
@@ -226,16 +344,93 @@ def scan_music_directory(
     return False
 
 
+class _AdaptiveBatchSize:
+    """Tune the upload batch size toward a target per-request wall time.
+
+    Starts from scan.batch_size and adjusts between MIN_SIZE and MAX_SIZE:
+    batches that finish under music_db.target_batch_seconds grow by 1.5x to
+    spend fewer round trips, while failures and timeouts halve the size so a
+    slow server gets smaller, safer requests.
+    """
+
+    MIN_SIZE = 16
+    MAX_SIZE = 512
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def current(self) -> int:
+        with self._lock:
+            if self._size is None:
+                self._size = max(self.MIN_SIZE, min(settings.scan.batch_size, self.MAX_SIZE))
+            return self._size
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            if self._size is None:
+                return
+            if not ok:
+                self._size = max(self.MIN_SIZE, self._size // 2)
+            elif elapsed < settings.music_db.target_batch_seconds:
+                self._size = min(self.MAX_SIZE, int(self._size * 1.5))
+
+
+_BATCH_SIZER = _AdaptiveBatchSize()
+
+_GZIP_MIN_BYTES = 4096
+
+
+def _encode_tracks(tracks: list[dict[str, Any]]) -> tuple[bytes, dict[str, str]]:
+    """Serialize a batch once with orjson, gzipping bodies worth compressing."""
+    body = orjson.dumps(tracks)
+    headers = {"Content-Type": "application/json"}
+    if len(body) > _GZIP_MIN_BYTES:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    return body, headers
+
+
+_SCAN_LOCK = threading.Lock()
+
+
+def _run_scan_in_thread(killer: GracefulKiller, **kwargs: Any) -> bool:
+    """Run a scan on a worker thread so the scheduler loop keeps turning.
+
+    A multi-hour scan used to run inline in the schedule callback, starving
+    run_pending and signal handling. Overlapping triggers are skipped via a
+    non-blocking lock so scans never stack; returns whether a scan actually
+    started so callers can re-arm their trigger on a skip.
+    """
+    if not _SCAN_LOCK.acquire(blocking=False):
+        log.info("`scan` A scan is already running, skipping this trigger")
+        return False
+
+    def _run() -> None:
+        try:
+            scan_music_directory(killer, **kwargs)
+        finally:
+            _SCAN_LOCK.release()
+
+    threading.Thread(target=_run, name="music2db-scan", daemon=True).start()
+    return True
+
+
 def _send_batch(tracks: list[dict[str, Any]]) -> bool:
     url = f"{settings.music_db.base_url}{settings.music_db.many_tracks_endpoint}"
+    body, headers = _encode_tracks(tracks)
     last_error = "unknown error"
 
     for attempt in range(1, settings.music_db.retry_count + 1):
         try:
             log.info("`http` Sending batch of %s tracks to server", len(tracks))
-            response = requests.post(url, json=tracks, timeout=settings.music_db.timeout_seconds)
+            started = time.monotonic()
+            response = SESSION.post(url, data=body, headers=headers, timeout=settings.music_db.timeout_seconds)
+            elapsed = time.monotonic() - started
 
             if response.status_code == 200:
+                _BATCH_SIZER.record(elapsed, ok=True)
+                _mark_server_healthy()
                 result = response.json()
                 errors = result.get("errors") if isinstance(result, dict) else None
                 if isinstance(result, dict) and result.get("message"):
@@ -247,6 +442,8 @@ def _send_batch(tracks: list[dict[str, Any]]) -> bool:
                     return False
                 return True
 
+            _BATCH_SIZER.record(elapsed, ok=False)
+            _mark_server_unhealthy()
             detail = _response_detail(response)
             last_error = f"HTTP {response.status_code}: {detail}"
             if response.status_code == 503 and attempt < settings.music_db.retry_count:
@@ -256,6 +453,8 @@ def _send_batch(tracks: list[dict[str, Any]]) -> bool:
             log.error("`http` Failed to send batch: %s", last_error)
             return False
         except requests.exceptions.RequestException as exc:
+            _BATCH_SIZER.record(settings.music_db.timeout_seconds, ok=False)
+            _mark_server_unhealthy()
             last_error = str(exc)
             if attempt < settings.music_db.retry_count:
                 _sleep_before_retry(attempt)
@@ -270,11 +469,87 @@ def _send_batch(tracks: list[dict[str, Any]]) -> bool:
     return False
 
 
-def _send_tracks_in_batches(tracks: list[dict[str, Any]]) -> bool:
+def _iter_ndjson(tracks: list[dict[str, Any]]) -> Iterator[bytes]:
+    for track_payload in tracks:
+        yield orjson.dumps(track_payload) + b"\n"
+
+
+def _send_tracks_ndjson(
+    tracks: list[dict[str, Any]],
+    on_batch_sent: Callable[[list[dict[str, Any]]], None] | None = None,
+) -> bool:
+    """Stream all tracks in one chunked NDJSON request.
+
+    Requires a server that accepts line-delimited tracks on
+    music_db.ndjson_endpoint; the body is generated lazily so client
+    memory stays flat regardless of how many tracks a scan produced.
+    """
+    url = f"{settings.music_db.base_url}{settings.music_db.ndjson_endpoint}"
+    try:
+        log.info("`http` Streaming %s tracks to server as NDJSON", len(tracks))
+        response = SESSION.post(
+            url,
+            data=_iter_ndjson(tracks),
+            headers={"Content-Type": "application/x-ndjson"},
+            timeout=settings.music_db.timeout_seconds,
+        )
+        if response.status_code != 200:
+            log.error("`http` Failed to stream tracks: HTTP %s: %s", response.status_code, _response_detail(response))
+            return False
+        if on_batch_sent is not None:
+            on_batch_sent(tracks)
+        return True
+    except requests.exceptions.RequestException as exc:
+        log.error("`http` Error streaming tracks to server: %s", exc)
+        return False
+
+
+def _send_tracks_in_batches(
+    tracks: list[dict[str, Any]],
+    on_batch_sent: Callable[[list[dict[str, Any]]], None] | None = None,
+) -> bool:
+    """Upload batches with a few in flight at once.
+
+    The pooled session keeps connections alive, so a small bounded thread
+    pool (scan.upload_workers) amortizes round-trip latency across batches
+    instead of waiting for each response before sending the next. Servers
+    that support it can take the whole scan as one streamed NDJSON request
+    instead (music_db.ndjson_endpoint). ``on_batch_sent`` fires after each
+    successfully delivered batch.
+    """
+    if settings.music_db.ndjson_endpoint:
+        return _send_tracks_ndjson(tracks, on_batch_sent)
+
     success = True
-    for index in range(0, len(tracks), settings.scan.batch_size):
-        if not _send_batch(tracks[index : index + settings.scan.batch_size]):
-            success = False
+    workers = max(1, settings.scan.upload_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Keep at most `workers` batches in flight and slice the next batch
+        # only when a slot frees up, so _BATCH_SIZER feedback from completed
+        # batches shapes the rest of this scan's upload, not just the next.
+        in_flight: dict[Future[bool], list[dict[str, Any]]] = {}
+        index = 0
+
+        def _collect(done: set[Future[bool]]) -> None:
+            nonlocal success
+            for future in done:
+                batch = in_flight.pop(future)
+                if future.result():
+                    if on_batch_sent is not None:
+                        on_batch_sent(batch)
+                else:
+                    success = False
+
+        while index < len(tracks):
+            if len(in_flight) >= workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+            batch_size = _BATCH_SIZER.current()
+            batch = tracks[index : index + batch_size]
+            in_flight[executor.submit(_send_batch, batch)] = batch
+            index += batch_size
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            _collect(done)
     return success
 
 
@@ -290,7 +565,7 @@ def _delete_track(file_path: str) -> bool:
     encoded_path = quote(file_path, safe="")
     url = f"{settings.music_db.base_url}{settings.music_db.delete_track_endpoint}?file_path={encoded_path}"
     try:
-        response = requests.delete(url, timeout=settings.music_db.timeout_seconds)
+        response = SESSION.delete(url, timeout=settings.music_db.timeout_seconds)
         if response.status_code != 200:
             log.error("`http` Failed to delete track %s: HTTP %s: %s", file_path, response.status_code, _response_detail(response))
             return False
@@ -309,7 +584,7 @@ def _delete_track(file_path: str) -> bool:
 def _list_server_tracks() -> set[str] | None:
     url = f"{settings.music_db.base_url}{settings.music_db.list_tracks_endpoint}"
     try:
-        response = requests.get(url, timeout=settings.music_db.timeout_seconds)
+        response = SESSION.get(url, timeout=settings.music_db.timeout_seconds)
         if response.status_code != 200:
             log.error("`http` Failed to list server tracks: HTTP %s: %s", response.status_code, _response_detail(response))
             return None
@@ -376,19 +651,25 @@ def _build_sync_plan(music_path: Path, manifest: Manifest, killer: GracefulKille
     next_files: dict[str, FileRecord] = {}
     metadata_errors = 0
 
+    pending: list[tuple[str, FileSnapshot]] = []
+    manifest_files = manifest.files
     for relative_path, snapshot in sorted(inventory.items()):
-        old_record = manifest.files.get(relative_path)
+        old_record = manifest_files.get(relative_path)
         needs_metadata = force or old_record is None or old_record.mtime != snapshot.mtime or old_record.size != snapshot.size
 
         if not needs_metadata and old_record is not None:
             next_files[relative_path] = old_record
             continue
+        pending.append((relative_path, snapshot))
 
-        try:
-            metadata = extract_metadata(snapshot.path)
-        except Exception as exc:
+    extracted = _extract_pending_metadata(pending)
+
+    for relative_path, snapshot in pending:
+        old_record = manifest_files.get(relative_path)
+        metadata, error = extracted[relative_path]
+        if error is not None:
             metadata_errors += 1
-            log.error("`metadata` Error processing %s: %s", snapshot.path, exc)
+            log.error("`metadata` Error processing %s: %s", snapshot.path, error)
             if old_record is not None:
                 next_files[relative_path] = old_record
             continue
@@ -419,26 +700,108 @@ def _build_sync_plan(music_path: Path, manifest: Manifest, killer: GracefulKille
     )
 
 
+_EXTRACT_CHUNK_SIZE = 64
+
+
+def _extract_chunk(paths: list[str]) -> list[tuple[str, dict[str, Any] | None, str | None]]:
+    """Worker for the metadata process pool; must stay importable at module scope."""
+    results: list[tuple[str, dict[str, Any] | None, str | None]] = []
+    for path in paths:
+        try:
+            results.append((path, extract_metadata(Path(path)), None))
+        except Exception as exc:
+            results.append((path, None, str(exc)))
+    return results
+
+
+def _extract_pending_metadata(pending: list[tuple[str, FileSnapshot]]) -> dict[str, tuple[dict[str, Any] | None, str | None]]:
+    """Extract metadata for pending files across all CPUs.
+
+    Tag parsing is CPU-bound pure Python and holds the GIL, so threads do
+    not help; files are shipped to a process pool in chunks to amortize the
+    submit/pickle overhead. Results are keyed by relative path; callers keep
+    their own deterministic order.
+    """
+    results: dict[str, tuple[dict[str, Any] | None, str | None]] = {}
+    if not pending:
+        return results
+
+    relative_by_path = {str(snapshot.path): relative_path for relative_path, snapshot in pending}
+    paths = list(relative_by_path)
+    if len(paths) <= _EXTRACT_CHUNK_SIZE:
+        # Incremental scans usually touch a handful of files; extracting
+        # inline beats forking a pool for milliseconds of work.
+        for path, metadata, error in _extract_chunk(paths):
+            results[relative_by_path[path]] = (metadata, error)
+        return results
+
+    workers = settings.scan.metadata_workers or os.cpu_count() or 1
+    chunks = [paths[index : index + _EXTRACT_CHUNK_SIZE] for index in range(0, len(paths), _EXTRACT_CHUNK_SIZE)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        for future in as_completed([executor.submit(_extract_chunk, chunk) for chunk in chunks]):
+            for path, metadata, error in future.result():
+                results[relative_by_path[path]] = (metadata, error)
+    return results
+
+
+def _scandir_recursive(
+    path: str | os.PathLike[str],
+    extensions: frozenset[str],
+    pruned_dirs: list[str] | None = None,
+) -> Iterator[os.DirEntry]:
+    """Yield wanted files below ``path``, reusing cached DirEntry metadata.
+
+    A directory containing a ``.ignore`` marker is pruned at descent time:
+    the whole subtree is skipped without stating any of its children.
+    Entries are filtered by extension before any type check, so non-audio
+    files cost nothing beyond the name comparison; symlinks never match
+    the d_type-based is_dir/is_file checks and are skipped for free.
+    """
+    files: list[os.DirEntry] = []
+    subdirs: list[os.DirEntry] = []
+    splitext = os.path.splitext
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name == ".ignore":
+                    if pruned_dirs is not None:
+                        pruned_dirs.append(str(path))
+                    return
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                    continue
+                if splitext(entry.name)[1].lower() not in extensions:
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    files.append(entry)
+    except OSError as exc:
+        # Unreadable directories (permissions, stale mounts) are valid input;
+        # skip the subtree like Path.rglob used to instead of killing the scan.
+        log.error("`scan` Error scanning %s: %s", path, exc)
+        return
+    yield from files
+    for subdir in subdirs:
+        yield from _scandir_recursive(subdir.path, extensions, pruned_dirs)
+
+
 def _build_inventory(music_path: Path, killer: GracefulKiller) -> dict[str, FileSnapshot]:
-    extensions = {extension.lower() for extension in settings.music.extensions}
-    ignored_dirs = {path.parent for path in music_path.rglob(".ignore")}
+    extensions = frozenset(extension.lower() for extension in settings.music.extensions)
+    ignored_dirs: list[str] = []
     inventory: dict[str, FileSnapshot] = {}
+    root = str(music_path)
+    # Bound local: attribute lookups add up over tens of thousands of entries.
+    relpath = os.path.relpath
 
-    for file_path in music_path.rglob("*"):
+    for entry in _scandir_recursive(root, extensions, ignored_dirs):
         if killer.kill_now:
             break
-        if file_path.is_symlink() or not file_path.is_file():
-            continue
-        if any(parent in ignored_dirs for parent in file_path.parents):
-            continue
-        if file_path.suffix.lower() not in extensions:
-            continue
+        file_path = Path(entry.path)
         try:
-            stat = file_path.stat()
+            stat = entry.stat()
         except OSError as exc:
             log.error("`state` Error stating %s: %s", file_path, exc)
             continue
-        relative_path = str(file_path.relative_to(music_path))
+        relative_path = relpath(entry.path, root)
         inventory[relative_path] = FileSnapshot(
             path=file_path,
             relative_path=relative_path,
@@ -477,20 +840,49 @@ def _log_dry_run_plan(plan: SyncPlan) -> None:
 
 
 def _load_manifest(music_path: Path) -> Manifest:
-    state_file = _state_file()
-    if not state_file.exists():
+    if not _state_db_file().exists():
+        legacy = _load_legacy_manifest()
+        if legacy is not None:
+            log.info("`state` Migrating legacy state.json manifest to sqlite")
+            return legacy
         return _empty_manifest(music_path)
 
+    try:
+        with closing(_open_state_db()) as connection:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            files = {
+                str(path): FileRecord(mtime=float(mtime), size=int(size), metadata_hash=str(metadata_hash))
+                for path, mtime, size, metadata_hash in connection.execute(
+                    "SELECT path, mtime, size, metadata_hash FROM files"
+                )
+            }
+    except sqlite3.Error as exc:
+        log.error("`state` Error reading state database: %s", exc)
+        return _empty_manifest(music_path)
+
+    return Manifest(
+        version=int(meta.get("version", 1)),
+        music_root=str(meta.get("music_root", music_path)),
+        last_scan=float(meta.get("last_scan", 0)),
+        last_server_audit=float(meta.get("last_server_audit", 0)),
+        files=files,
+    )
+
+
+def _load_legacy_manifest() -> Manifest | None:
+    state_file = _state_dir() / "state.json"
+    if not state_file.exists():
+        return None
+
     try:
         with state_file.open("r", encoding="utf-8") as file:
             raw = json.load(file)
     except Exception as exc:
-        log.error("`state` Error reading state file: %s", exc)
-        return _empty_manifest(music_path)
+        log.error("`state` Error reading legacy state file: %s", exc)
+        return None
 
     if "files" not in raw:
-        log.info("`state` Migrating legacy state file without manifest")
-        return _empty_manifest(music_path)
+        return None
 
     files = {}
     for relative_path, record in raw.get("files", {}).items():
@@ -505,7 +897,7 @@ def _load_manifest(music_path: Path) -> Manifest:
 
     return Manifest(
         version=int(raw.get("version", 1)),
-        music_root=str(raw.get("music_root", music_path)),
+        music_root=str(raw.get("music_root", "")),
         last_scan=float(raw.get("last_scan", 0)),
         last_server_audit=float(raw.get("last_server_audit", 0)),
         files=files,
@@ -513,40 +905,67 @@ def _load_manifest(music_path: Path) -> Manifest:
 
 
 def _save_manifest(manifest: Manifest) -> None:
-    state_file = _state_file()
-    tmp_file = state_file.with_suffix(".tmp")
-    payload = {
-        "version": manifest.version,
-        "music_root": manifest.music_root,
-        "last_scan": manifest.last_scan,
-        "last_server_audit": manifest.last_server_audit,
-        "files": {relative_path: asdict(record) for relative_path, record in sorted(manifest.files.items())},
-    }
     try:
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        with tmp_file.open("w", encoding="utf-8") as file:
-            json.dump(payload, file, ensure_ascii=False, indent=2, sort_keys=True)
-            file.write("\n")
-        tmp_file.replace(state_file)
-    except Exception as exc:
+        with closing(_open_state_db()) as connection, connection:
+            connection.execute("DELETE FROM files")
+            connection.executemany(
+                "INSERT INTO files (path, mtime, size, metadata_hash) VALUES (?, ?, ?, ?)",
+                [
+                    (relative_path, record.mtime, record.size, record.metadata_hash)
+                    for relative_path, record in manifest.files.items()
+                ],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("version", str(manifest.version)),
+                    ("music_root", manifest.music_root),
+                    ("last_scan", str(manifest.last_scan)),
+                    ("last_server_audit", str(manifest.last_server_audit)),
+                ],
+            )
+    except sqlite3.Error as exc:
         log.error("`state` Error saving manifest: %s", exc)
 
 
+def _upsert_file_records(records: dict[str, FileRecord]) -> None:
+    """Persist just-sent file records so an interrupted scan resumes where it stopped."""
+    try:
+        with closing(_open_state_db()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO files (path, mtime, size, metadata_hash) VALUES (?, ?, ?, ?)",
+                [
+                    (relative_path, record.mtime, record.size, record.metadata_hash)
+                    for relative_path, record in records.items()
+                ],
+            )
+    except sqlite3.Error as exc:
+        log.error("`state` Error saving sent batch records: %s", exc)
+
+
 def _empty_manifest(music_path: Path) -> Manifest:
     return Manifest(version=1, music_root=str(music_path), last_scan=0, last_server_audit=0, files={})
 
 
-def _state_file() -> Path:
-    return Path(os.getenv("XDG_STATE_HOME", os.path.join(HOME_DIR, ".local/state"))) / APP_NAME / "state.json"
+def _open_state_db() -> sqlite3.Connection:
+    state_db = _state_db_file()
+    state_db.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(state_db)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS files ("
+        "path TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL, metadata_hash TEXT NOT NULL)"
+    )
+    return connection
+
+
+def _state_db_file() -> Path:
+    return _state_dir() / "state.sqlite"
 
 
-def _join_id3_text(frames: list[Any]) -> str | None:
-    values = []
-    for frame in frames:
-        text = getattr(frame, "text", None)
-        if text:
-            values.append(str(text[0]))
-    return " & ".join(values) if values else None
+def _state_dir() -> Path:
+    return Path(os.getenv("XDG_STATE_HOME", os.path.join(HOME_DIR, ".local/state"))) / APP_NAME
 
 
 def _first_tag_value(tags: Any, key: str) -> Any:
@@ -632,9 +1051,21 @@ def main() -> int:
     _init_config(args.config_file)
     _init_logs()
 
-    killer = GracefulKiller(kill_targets=[schedule.clear])
+    wake = threading.Event()
+    killer = GracefulKiller(kill_targets=[schedule.clear, wake.set])
     log.info("`startup` Starting %s", APP_NAME)
-    schedule.every().day.at(settings.music.scan_time).do(scan_music_directory, killer)
+    schedule.every().day.at(settings.music.scan_time).do(_run_scan_in_thread, killer)
+
+    watcher: MusicWatcher | None = None
+    if settings.music.watch and not args.run_once:
+        watcher = MusicWatcher(
+            settings.music.path.expanduser(),
+            settings.music.extensions,
+            debounce_seconds=settings.music.watch_debounce_seconds,
+            wake_event=wake,
+        )
+        if not watcher.start():
+            watcher = None
 
     if not args.dont_scan_now:
         scan_music_directory(
@@ -651,8 +1082,23 @@ def main() -> int:
 
     while not killer.kill_now:
         schedule.run_pending()
-        time.sleep(15)
-
+        if watcher is not None and watcher.scan_due():
+            log.info("`scan` File changes detected, starting incremental sync")
+            if not _run_scan_in_thread(killer):
+                # A scan is already running and may have walked past the
+                # changed files; re-arm so the trigger fires again after it.
+                watcher.mark_dirty()
+        # Sleep until the next scheduled scan (capped at an hour), a signal,
+        # or a watcher event; no fixed-interval polling.
+        idle = schedule.idle_seconds()
+        timeout = max(1.0, min(idle if idle is not None else 3600, 3600))
+        if watcher is not None and watcher.pending():
+            timeout = min(timeout, settings.music.watch_debounce_seconds)
+        wake.wait(timeout)
+        wake.clear()
+
+    if watcher is not None:
+        watcher.stop()
     log.info("`startup` Shutting down %s", APP_NAME)
     return 0
 
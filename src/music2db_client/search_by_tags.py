@@ -5,10 +5,11 @@ import argparse
 from urllib.parse import urlencode
 
 import requests
-from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+from .utils import _common_console
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Search Music2DB tracks by semantic text and metadata")
@@ -20,7 +21,7 @@ def main() -> int:
     parser.add_argument("--url", default="http://kimihome.lan:5005", help="Server URL")
     args = parser.parse_args()
 
-    console = Console()
+    console = _common_console
     if not args.tags and not args.artist and not args.album:
         console.print("\n[red]Error: provide tags, --artist, or --album[/]")
         return 1
@@ -19,6 +19,8 @@ class MusicSettings(BaseModel):
     path: Path
     scan_time: str = "04:00"
     extensions: list[str] = Field(default_factory=lambda: [".mp3", ".flac", ".m4a", ".ogg"])
+    watch: bool = False
+    watch_debounce_seconds: float = 5
 
 
 class MusicDbSettings(BaseModel):
@@ -28,11 +30,13 @@ class MusicDbSettings(BaseModel):
     port: int = 5005
     one_track_endpoint: str = "/add_track/"
     many_tracks_endpoint: str = "/add_tracks/"
+    ndjson_endpoint: str | None = None
     delete_track_endpoint: str = "/delete_track/"
     list_tracks_endpoint: str = "/list_tracks/"
     timeout_seconds: float = 30
     retry_count: int = 3
     retry_backoff_seconds: float = 2
+    target_batch_seconds: float = 1.0
 
     @property
     def base_url(self) -> str:
@@ -43,6 +47,8 @@ class ScanSettings(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     batch_size: int = 100
+    metadata_workers: int = 0
+    upload_workers: int = 4
 
 
 class SyncSettings(BaseModel):
@@ -2,9 +2,9 @@
 
 import argparse
 from pathlib import Path
-from rich.console import Console
 from rich.pretty import Pretty
 from .main import extract_metadata
+from .utils import _common_console
 
 def main():
     parser = argparse.ArgumentParser(description="Show metadata that would be sent to server for a music file")
@@ -21,7 +21,7 @@ def main():
         "metadata": metadata
     }
 
-    console = Console()
+    console = _common_console
     console.print("\n[bold blue]Request that would be sent to server:[/]")
     console.print(Pretty(request_data, expand_all=True))
 
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import signal
+import threading
 from collections.abc import Callable
 
 
 class GracefulKiller:
     def __init__(self, kill_targets: list[Callable[[], None]] | None = None) -> None:
-        self.kill_now = False
+        self._event = threading.Event()
         self._kill_targets = kill_targets or []
         signal.signal(signal.SIGINT, self.exit_gracefully)
         signal.signal(signal.SIGTERM, self.exit_gracefully)
 
+    @property
+    def kill_now(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Sleep until the timeout elapses or a termination signal arrives."""
+        return self._event.wait(timeout)
+
     def exit_gracefully(self, signum: int, frame: object | None) -> None:
-        self.kill_now = True
+        self._event.set()
         for target in self._kill_targets:
             target()
@@ -1,40 +1,89 @@
 # pyright: basic
 # pyright: reportAttributeAccessIssue=false
 
+import logging
+import os
 import re
+import sys
+from rich.console import Console
 from rich.pretty import pretty_repr
 from rich.theme import Theme
 from rich.traceback import install as install_rich_traceback
 from rich.tree import Tree
-# from deepdiff import DeepDiff
 # from state import State
-from .logging_setup import get_logger
+from .logging_setup import get_logger, register_reconfigure_hook
 
 log = get_logger(__name__)
-install_rich_traceback(show_locals=True)
 
-# def _log_state(state: State, tabs: int = 0):
-#     log.debug(pretty_repr(state, indent_size=4, max_string=50))
+_DEBUG_ENABLED = False
+_USE_RICH_MARKUP = False
 
 
-# def _parse_key(key: str):
-#     # log.debug(f"key: {key}")
-#     # Regular expression pattern to match root['path1']['path2']...[index]
-#     pattern = r"^root(\['(?:[^']+)'\])+\[(\d+)\]$"
-#     path_pattern = r"'\s*([^']*)\s*'"  # Pattern to extract individual path segments
+def _refresh_logging_state() -> None:
+    """Cache hot logging lookups; re-run whenever logging is reconfigured."""
+    global _DEBUG_ENABLED, _USE_RICH_MARKUP
+    _DEBUG_ENABLED = log.isEnabledFor(logging.DEBUG)
+    _USE_RICH_MARKUP = _rich_handler_active()
 
-#     main_match = re.match(pattern, key)
-#     if main_match:
-#         # Extract all path segments
-#         path_segments = re.findall(path_pattern, main_match.group(0))
 
-#         # Extract the index, assuming the last part of the main match
-#         index = int(main_match.group(2))
-#         return path_segments, index
-#     else:
-#         # log.error("Input string is not in the expected format")
-#         # raise ValueError(f"Input string is not in the expected format: {key}")
-#         return [], 0
+def _rich_handler_active() -> bool:
+    try:
+        from rich.logging import RichHandler
+    except ImportError:
+        return False
+    logger: logging.Logger | None = log
+    while logger is not None:
+        if any(isinstance(handler, RichHandler) for handler in logger.handlers):
+            return True
+        if not logger.propagate:
+            return False
+        logger = logger.parent
+    return False
+
+
+register_reconfigure_hook(_refresh_logging_state)
+
+# show_locals makes Rich repr() every local on a crash, which can take
+# seconds with large objects. Only worth it when a human is watching;
+# RICH_TRACEBACK=1/0 overrides the TTY autodetection.
+_rich_traceback = os.getenv("RICH_TRACEBACK", "auto")
+if _rich_traceback == "1" or (_rich_traceback == "auto" and sys.stderr.isatty()):
+    install_rich_traceback(show_locals=True)
+
+class _LazyRepr:
+    """Defer pretty_repr until a handler actually renders the record.
+
+    Pass instances as %s logging args; Rich formatting then only runs for
+    records that survive the level filter.
+    """
+
+    __slots__ = ("obj", "kwargs")
+
+    def __init__(self, obj: object, **kwargs: object) -> None:
+        self.obj = obj
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return pretty_repr(self.obj, **self.kwargs)
+
+
+def _log_state(state: object, tabs: int = 0):
+    log.debug("%s", _LazyRepr(state, indent_size=4, max_string=50))
+
+
+# Compiled once at import; recompiling per call would pay pattern-cache
+# lookups in tight parsing loops.
+_KEY_PATTERN = re.compile(r"^root(\['(?:[^']+)'\])+\[(\d+)\]$")  # root['path1']['path2']...[index]
+_PATH_PATTERN = re.compile(r"'\s*([^']*)\s*'")  # individual path segments
+
+
+def _parse_key(key: str) -> tuple[list[str], int]:
+    main_match = _KEY_PATTERN.match(key)
+    if main_match:
+        path_segments = _PATH_PATTERN.findall(main_match.group(0))
+        index = int(main_match.group(2))
+        return path_segments, index
+    return [], 0
 
 
 # def _grow_branch(tree: Tree, action: str, list_of_names: list[str], index: int, value):
@@ -46,72 +95,99 @@ install_rich_traceback(show_locals=True)
 #     current_branch.add(pretty_repr(value))
 #     return tree
 
-def sep_line(name: str, length: int = 90, color: str = 'light steel blue', symbol: str = '─'):
-    line_length = (length - len(name) - 2) // 2
-    line = f"{symbol * line_length} {name} {symbol * line_length}"
-    while len(line) < length:
-        line += symbol
-    while len(line) > length:
-        line = line[:-1]
-    log.debug(f"[{color}]{line}[/]")
-
-
-# def log_diff(dict1, dict2):
-#     diff = DeepDiff(dict1, dict2)
-#     for key, value in diff.items():
-#         try:
-#             if key.endswith('added'):
-#                 for k, v in value.items():
-#                     log.debug(f'[chartreuse2 underline] + {k}:[/]\n{pretty_repr(v)}')
-#             elif key.endswith('removed'):
-#                 for k, v in value.items():
-#                     log.debug(f'[deep_pink4 underline] - {k}:[/]\n{pretty_repr(v)}')
-#             elif key.endswith('changed'):
-#                 for k, v in value.items():
-#                     log.debug(f'[orange3 underline] ~ {k}:[/]\n{pretty_repr(v)}')
-#             else:
-#                 log.debug(f"{key}:" + pretty_repr(value))
-#         except AttributeError as e:
-#             log.error(f'Key {key} does not contain items.')
-
-common_theme = Theme({
-    "repr.attrib_name": "khaki3",
-    "repr.attrib_value": "medium_orchid3",
-    "repr.number": "pale_turquoise1",
-    "repr.str": "cadet_blue",
-    "repr.none": "navajo_white3",
-    "repr.bool_true": "medium_spring_green",
-    "repr.bool_false": "light_salmon3",
-    "repr.call": "medium_purple3",
-    "repr.ellipsis": "medium_orchid3",
-    'repr.uuid': "plum4",
-    
-    })
-
-log_theme = Theme({
-    "repr.attrib_name": "khaki3",
-    "repr.attrib_value": "medium_orchid3",
-    "repr.number": "pale_turquoise1",
-    "repr.str": "cadet_blue",
-    "repr.none": "navajo_white3",
-    "repr.bool_true": "medium_spring_green",
-    "repr.bool_false": "light_salmon3",
-    "repr.call": "medium_purple3",
-    "repr.ellipsis": "medium_orchid3",
-    'repr.uuid': "plum4",
-    
-    })
+# Colors come from a handful of literals in practice, so the cache stays tiny.
+_PREFIX_CACHE: dict[str, str] = {}
+
+
+def _color_prefix(color: str) -> str:
+    prefix = _PREFIX_CACHE.get(color)
+    if prefix is None:
+        prefix = _PREFIX_CACHE[color] = f"[{color}]"
+    return prefix
+
+
+# Slicing a prebuilt slab beats rebuilding `symbol * half` on every call
+# with the default symbol; 512 covers any sane separator length.
+_DEFAULT_SYMBOL = '\u2500'  # ─ BOX DRAWINGS LIGHT HORIZONTAL
+_DEFAULT_FILL = _DEFAULT_SYMBOL * 512
+
+
+def sep_line(name: str, length: int = 90, color: str = 'light steel blue', symbol: str = _DEFAULT_SYMBOL):
+    if not _DEBUG_ENABLED:
+        return
+    sym_len = len(symbol)
+    half = max(0, (length - len(name) - 2) // (2 * sym_len))
+    if symbol is _DEFAULT_SYMBOL and half <= len(_DEFAULT_FILL):
+        fill = _DEFAULT_FILL[:half]
+    else:
+        fill = symbol * half
+    line = f"{fill} {name} {fill}"
+    short = length - len(line)
+    if short > 0:
+        line += (symbol * ((short + sym_len - 1) // sym_len))[:short]
+    elif short < 0:
+        line = line[:length]
+    if _USE_RICH_MARKUP:
+        log.debug("%s%s[/]", _color_prefix(color), line)
+    else:
+        log.debug("%s", line)
+
+
+def log_diff(old: dict, new: dict) -> None:
+    """Log added/removed/changed top-level keys between two dicts at DEBUG.
+
+    Plain key-set arithmetic instead of DeepDiff: the dicts compared here
+    are shallow state snapshots, and deep diffing walked every nested value
+    even when logging was off.
+    """
+    if not _DEBUG_ENABLED:
+        return
+    if _USE_RICH_MARKUP:
+        added_fmt = "[chartreuse2 underline] + %s:[/]\n%s"
+        removed_fmt = "[deep_pink4 underline] - %s:[/]\n%s"
+        changed_fmt = "[orange3 underline] ~ %s:[/]\n%s"
+    else:
+        added_fmt = " + %s:\n%s"
+        removed_fmt = " - %s:\n%s"
+        changed_fmt = " ~ %s:\n%s"
+    old_keys = old.keys()
+    new_keys = new.keys()
+    for key in new_keys - old_keys:
+        log.debug(added_fmt, key, _LazyRepr(new[key]))
+    for key in old_keys - new_keys:
+        log.debug(removed_fmt, key, _LazyRepr(old[key]))
+    for key in old_keys & new_keys:
+        if old[key] != new[key]:
+            log.debug(changed_fmt, key, _LazyRepr(new[key]))
+
+# Tuple of pairs keeps the shared base immutable; each theme builds its
+# own dict from it, so neither can mutate the other's styles.
+_BASE_STYLES = (
+    ("repr.attrib_name", "khaki3"),
+    ("repr.attrib_value", "medium_orchid3"),
+    ("repr.number", "pale_turquoise1"),
+    ("repr.str", "cadet_blue"),
+    ("repr.none", "navajo_white3"),
+    ("repr.bool_true", "medium_spring_green"),
+    ("repr.bool_false", "light_salmon3"),
+    ("repr.call", "medium_purple3"),
+    ("repr.ellipsis", "medium_orchid3"),
+    ("repr.uuid", "plum4"),
+)
+
+common_theme = Theme(dict(_BASE_STYLES))
+
+# Identical style set; alias instead of parsing the same styles twice.
+log_theme = common_theme
 
 prompt_theme = Theme({
+    **dict(_BASE_STYLES),
     "repr.attrib_name": "tan",
     "repr.attrib_value": "orchid",
-    "repr.number": "pale_turquoise1",
     "repr.str": "grey63",
-    "repr.none": "navajo_white3",
-    "repr.bool_true": "medium_spring_green",
-    "repr.bool_false": "light_salmon3",
-    "repr.call": "medium_purple3",
-    "repr.ellipsis": "medium_orchid3",
-    'repr.uuid': "plum4",
-    
-    })
+})
+
+# Console construction parses every theme style; build one of each per
+# process and let call sites reuse them.
+_common_console = Console(theme=common_theme, highlight=True, soft_wrap=True)
+_prompt_console = Console(theme=prompt_theme, highlight=True, soft_wrap=True)
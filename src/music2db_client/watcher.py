@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from .logging_setup import get_logger
+
+log = get_logger(__name__)
+
+
+class MusicWatcher:
+    """Request rescans from filesystem change notifications instead of polling.
+
+    Subscribes to kernel events (inotify/FSEvents via watchdog) below the
+    music directory and marks the library dirty when an audio file changes.
+    Once events settle for the debounce window, `scan_due()` reports that an
+    incremental scan should run; the manifest diff keeps that scan cheap.
+    The daily scheduled scan stays in place as a fallback for network mounts
+    that do not emit events.
+    """
+
+    def __init__(
+        self,
+        music_path: Path,
+        extensions: list[str],
+        debounce_seconds: float = 5.0,
+        wake_event: threading.Event | None = None,
+    ) -> None:
+        self._music_path = str(music_path)
+        self._extensions = {extension.lower() for extension in extensions}
+        self._debounce_seconds = debounce_seconds
+        self._wake_event = wake_event
+        self._lock = threading.Lock()
+        self._last_event = 0.0
+        self._dirty = False
+        self._observer = None
+
+    def start(self) -> bool:
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            log.error("`scan` music.watch is enabled but watchdog is not installed; falling back to scheduled scans")
+            return False
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_created(self, event) -> None:
+                watcher._note(event)
+
+            def on_modified(self, event) -> None:
+                watcher._note(event)
+
+            def on_moved(self, event) -> None:
+                watcher._note(event, getattr(event, "dest_path", None))
+
+            def on_deleted(self, event) -> None:
+                watcher._note(event)
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_Handler(), self._music_path, recursive=True)
+        observer.start()
+        self._observer = observer
+        log.info("`scan` Watching %s for changes (debounce %.0fs)", self._music_path, self._debounce_seconds)
+        return True
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def mark_dirty(self) -> None:
+        """Re-arm the dirty flag when a due scan could not be started."""
+        with self._lock:
+            self._dirty = True
+            self._last_event = time.monotonic()
+
+    def pending(self) -> bool:
+        """Return True while changes are waiting out the debounce window."""
+        with self._lock:
+            return self._dirty
+
+    def scan_due(self) -> bool:
+        """Return True once changes have settled; clears the dirty flag."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            if time.monotonic() - self._last_event < self._debounce_seconds:
+                return False
+            self._dirty = False
+            return True
+
+    def _note(self, event: object, path: str | None = None) -> None:
+        path = path or str(getattr(event, "src_path", ""))
+        if getattr(event, "is_directory", False):
+            return
+        if os.path.splitext(path)[1].lower() not in self._extensions:
+            return
+        with self._lock:
+            self._dirty = True
+            self._last_event = time.monotonic()
+        if self._wake_event is not None:
+            self._wake_event.set()
@@ -0,0 +1,43 @@
+import logging
+from logging.handlers import MemoryHandler
+
+from music2db_client import logging_setup
+
+
+def test_setup_logging_buffers_records_when_capacity_set():
+    logger = logging_setup.setup_logging({"level": "INFO", "buffer_capacity": 100})
+    try:
+        assert logger.handlers
+        assert all(isinstance(handler, MemoryHandler) for handler in logger.handlers)
+
+        logger.info("buffered message")
+        assert logger.handlers[0].buffer
+
+        logging_setup.flush_logs()
+        assert not logger.handlers[0].buffer
+    finally:
+        logging_setup._memory_handlers.clear()
+        logger.handlers.clear()
+        logger.filters.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+
+
+def test_reconfiguring_to_unbuffered_flushes_old_buffers():
+    logger = logging_setup.setup_logging({"level": "INFO", "buffer_capacity": 100})
+    try:
+        logger.info("still buffered")
+        old_handler = logger.handlers[0]
+        assert old_handler.buffer
+
+        logger = logging_setup.setup_logging({"level": "INFO", "buffer_capacity": 0})
+
+        assert not old_handler.buffer
+        assert not logging_setup._memory_handlers
+        assert not any(isinstance(handler, MemoryHandler) for handler in logger.handlers)
+    finally:
+        logging_setup._memory_handlers.clear()
+        logger.handlers.clear()
+        logger.filters.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
@@ -1,7 +1,10 @@
+import os
 from types import SimpleNamespace
 
+import pytest
+
 from music2db_client import main
-from music2db_client.settings import MusicDbSettings, MusicSettings, Settings
+from music2db_client.settings import MusicDbSettings, MusicSettings, ScanSettings, Settings
 
 
 def test_sanitize_metadata_keeps_only_json_primitives():
@@ -32,7 +35,7 @@ def test_health_requires_chromadb_and_embeddings_ok(monkeypatch, tmp_path):
         def json(self):
             return {"status": "Server is running", "chromadb": "ok", "embeddings": "error"}
 
-    monkeypatch.setattr(main.requests, "get", lambda url, timeout: Response())
+    monkeypatch.setattr(main.SESSION, "get", lambda url, timeout: Response())
 
     assert main.check_server_health() is False
 
@@ -49,11 +52,23 @@ def test_health_accepts_contract_response(monkeypatch, tmp_path):
             "embedding_model": "intfloat/multilingual-e5-small",
         },
     )
-    monkeypatch.setattr(main.requests, "get", lambda url, timeout: response)
+    monkeypatch.setattr(main.SESSION, "get", lambda url, timeout: response)
 
     assert main.check_server_health() is True
 
 
+def test_scan_skips_health_probe_when_recently_confirmed(monkeypatch, tmp_path):
+    import time
+
+    main.settings = Settings(music=MusicSettings(path=tmp_path))
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+    monkeypatch.setattr(main, "_server_healthy_until", time.monotonic() + 60)
+    monkeypatch.setattr(main, "check_server_health", lambda: pytest.fail("unexpected health probe"))
+    monkeypatch.setattr(main, "_server_audit_due", lambda manifest: False)
+
+    assert main.scan_music_directory(SimpleNamespace(kill_now=False)) is True
+
+
 def test_build_sync_plan_sends_new_and_changed_and_deletes_missing(monkeypatch, tmp_path):
     main.settings = Settings(music=MusicSettings(path=tmp_path))
     unchanged = tmp_path / "unchanged.mp3"
@@ -89,6 +104,41 @@ def test_build_sync_plan_sends_new_and_changed_and_deletes_missing(monkeypatch,
     assert set(plan.manifest.files) == {"unchanged.mp3", "changed.mp3", "new.mp3"}
 
 
+def test_build_inventory_prunes_ignored_subtrees(monkeypatch, tmp_path):
+    main.settings = Settings(music=MusicSettings(path=tmp_path))
+    (tmp_path / "keep.mp3").write_bytes(b"audio")
+    ignored = tmp_path / "ignored"
+    nested = ignored / "nested"
+    nested.mkdir(parents=True)
+    (ignored / ".ignore").write_bytes(b"")
+    (ignored / "skip.mp3").write_bytes(b"audio")
+    (nested / "skip-too.mp3").write_bytes(b"audio")
+
+    inventory = main._build_inventory(tmp_path, SimpleNamespace(kill_now=False))
+
+    assert set(inventory) == {"keep.mp3"}
+
+
+def test_scandir_recursive_skips_unreadable_directories(monkeypatch, tmp_path):
+    (tmp_path / "keep.mp3").write_bytes(b"audio")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    (locked / "hidden.mp3").write_bytes(b"audio")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if str(path) == str(locked):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(main.os, "scandir", scandir)
+
+    names = [entry.name for entry in main._scandir_recursive(str(tmp_path), frozenset({".mp3"}))]
+
+    assert names == ["keep.mp3"]
+
+
 def test_delete_track_url_encodes_file_path(monkeypatch, tmp_path):
     main.settings = Settings(
         music=MusicSettings(path=tmp_path),
@@ -107,12 +157,52 @@ def test_delete_track_url_encodes_file_path(monkeypatch, tmp_path):
         captured["timeout"] = timeout
         return Response()
 
-    monkeypatch.setattr(main.requests, "delete", delete)
+    monkeypatch.setattr(main.SESSION, "delete", delete)
 
     assert main._delete_track("Artist/Album/Track 1.mp3") is True
     assert captured["url"] == "http://server:5005/delete_track/?file_path=Artist%2FAlbum%2FTrack%201.mp3"
 
 
+def test_adaptive_batch_size_grows_on_fast_success_and_halves_on_failure(tmp_path):
+    main.settings = Settings(music=MusicSettings(path=tmp_path))
+    sizer = main._AdaptiveBatchSize()
+
+    assert sizer.current() == 100
+    sizer.record(0.1, ok=True)
+    assert sizer.current() == 150
+    sizer.record(30, ok=False)
+    assert sizer.current() == 75
+    for _ in range(5):
+        sizer.record(30, ok=False)
+    assert sizer.current() == main._AdaptiveBatchSize.MIN_SIZE
+
+
+def test_encode_tracks_gzips_only_large_bodies():
+    import gzip
+    import json
+
+    small = [{"file_path": "a.mp3", "metadata": {"title": "a"}}]
+    body, headers = main._encode_tracks(small)
+    assert headers == {"Content-Type": "application/json"}
+    assert json.loads(body) == small
+
+    large = [{"file_path": f"{index}.mp3", "metadata": {"title": "x" * 100}} for index in range(100)]
+    body, headers = main._encode_tracks(large)
+    assert headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(body)) == large
+
+
+def test_iter_ndjson_yields_one_json_line_per_track():
+    import json
+
+    tracks = [{"file_path": "a.mp3", "metadata": {"title": "a"}}, {"file_path": "b.mp3", "metadata": {}}]
+
+    lines = list(main._iter_ndjson(tracks))
+
+    assert all(line.endswith(b"\n") for line in lines)
+    assert [json.loads(line) for line in lines] == tracks
+
+
 def test_save_and_load_manifest_roundtrip(monkeypatch, tmp_path):
     state_home = tmp_path / "state"
     monkeypatch.setenv("XDG_STATE_HOME", str(state_home))
@@ -132,6 +222,67 @@ def test_save_and_load_manifest_roundtrip(monkeypatch, tmp_path):
     assert loaded.files["track.mp3"].metadata_hash == "abc"
 
 
+def test_load_manifest_migrates_legacy_state_json(monkeypatch, tmp_path):
+    state_home = tmp_path / "state"
+    state_dir = state_home / "music2db-client"
+    state_dir.mkdir(parents=True)
+    monkeypatch.setenv("XDG_STATE_HOME", str(state_home))
+    (state_dir / "state.json").write_text(
+        '{"version": 1, "music_root": "/music", "last_scan": 7, "last_server_audit": 3,'
+        ' "files": {"track.mp3": {"mtime": 1.5, "size": 10, "metadata_hash": "abc"}}}',
+        encoding="utf-8",
+    )
+
+    loaded = main._load_manifest(tmp_path)
+
+    assert loaded.last_scan == 7
+    assert loaded.files["track.mp3"].metadata_hash == "abc"
+
+
+def test_sent_batches_fire_callback_only_on_success(monkeypatch, tmp_path):
+    main.settings = Settings(music=MusicSettings(path=tmp_path))
+    recorded = []
+    monkeypatch.setattr(main, "_send_batch", lambda batch: batch[0]["file_path"] == "a.mp3")
+    monkeypatch.setattr(main._BATCH_SIZER, "current", lambda: 1)
+
+    tracks = [{"file_path": "a.mp3", "metadata": {}}, {"file_path": "b.mp3", "metadata": {}}]
+    result = main._send_tracks_in_batches(
+        tracks,
+        on_batch_sent=lambda batch: recorded.extend(track["file_path"] for track in batch),
+    )
+
+    assert result is False
+    assert recorded == ["a.mp3"]
+
+
+def test_batch_size_feedback_applies_within_a_scan(monkeypatch, tmp_path):
+    main.settings = Settings(music=MusicSettings(path=tmp_path), scan=ScanSettings(upload_workers=1))
+    sizes = []
+    current = {"value": 1}
+
+    def send(batch):
+        sizes.append(len(batch))
+        current["value"] = 2
+        return True
+
+    monkeypatch.setattr(main, "_send_batch", send)
+    monkeypatch.setattr(main._BATCH_SIZER, "current", lambda: current["value"])
+
+    tracks = [{"file_path": f"{index}.mp3", "metadata": {}} for index in range(5)]
+
+    assert main._send_tracks_in_batches(tracks) is True
+    assert sizes == [1, 2, 2]
+
+
+def test_upsert_file_records_persists_without_full_manifest_save(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / "state"))
+
+    main._upsert_file_records({"track.mp3": main.FileRecord(mtime=1.0, size=2, metadata_hash="h")})
+
+    loaded = main._load_manifest(tmp_path)
+    assert loaded.files["track.mp3"].size == 2
+
+
 def test_audit_respects_runtime_no_delete(monkeypatch, tmp_path):
     main.settings = Settings(music=MusicSettings(path=tmp_path))
     deleted = []
@@ -171,7 +322,7 @@ def test_scan_saves_manifest_for_successful_files_when_metadata_errors(monkeypat
     monkeypatch.setenv("XDG_STATE_HOME", str(state_home))
     monkeypatch.setattr(main, "check_server_health", lambda: True)
     monkeypatch.setattr(main, "_server_audit_due", lambda manifest: False)
-    monkeypatch.setattr(main, "_send_tracks_in_batches", lambda tracks: sent.extend(tracks) or True)
+    monkeypatch.setattr(main, "_send_tracks_in_batches", lambda tracks, **kwargs: sent.extend(tracks) or True)
 
     def metadata(file_path):
         if file_path.name == "broken.mp3":
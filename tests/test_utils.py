@@ -0,0 +1,66 @@
+import logging
+
+from music2db_client import utils
+
+
+def _emitted_line(record: logging.LogRecord) -> str:
+    message = record.getMessage()
+    if message.startswith("[") and message.endswith("[/]"):
+        return message[message.index("]") + 1 : -len("[/]")]
+    return message
+
+
+def test_sep_line_emits_exact_length(caplog):
+    with caplog.at_level(logging.DEBUG, logger="music2db-client"):
+        utils._refresh_logging_state()
+        utils.sep_line("name", length=40)
+        utils.sep_line("odd", length=41)
+        utils.sep_line("multi", length=40, symbol="=-")
+    utils._refresh_logging_state()
+
+    assert [len(_emitted_line(record)) for record in caplog.records] == [40, 41, 40]
+
+
+def test_sep_line_centers_name_beyond_default_fill(caplog):
+    with caplog.at_level(logging.DEBUG, logger="music2db-client"):
+        utils._refresh_logging_state()
+        utils.sep_line("name", length=1200)
+    utils._refresh_logging_state()
+
+    line = _emitted_line(caplog.records[0])
+    assert len(line) == 1200
+    assert line.index(" name ") == (1200 - len("name") - 2) // 2
+
+
+def test_lazy_repr_formats_only_on_str():
+    from rich.pretty import pretty_repr
+
+    lazy = utils._LazyRepr({"key": "value"}, max_string=50)
+
+    assert str(lazy) == pretty_repr({"key": "value"}, max_string=50)
+
+
+def test_log_diff_reports_added_removed_and_changed_keys(caplog):
+    with caplog.at_level(logging.DEBUG, logger="music2db-client"):
+        utils._refresh_logging_state()
+        utils.log_diff(
+            {"removed": 1, "changed": "before", "same": True},
+            {"added": 2, "changed": "after", "same": True},
+        )
+    utils._refresh_logging_state()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert sorted(message.split(":")[0] for message in messages) == [
+        " + added",
+        " - removed",
+        " ~ changed",
+    ]
+
+
+def test_sep_line_is_a_noop_when_debug_disabled(caplog):
+    with caplog.at_level(logging.INFO, logger="music2db-client"):
+        utils._refresh_logging_state()
+        utils.sep_line("name", length=40)
+    utils._refresh_logging_state()
+
+    assert caplog.records == []
@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from music2db_client.watcher import MusicWatcher
+
+
+def test_scan_due_after_debounce_and_flag_reset(tmp_path):
+    watcher = MusicWatcher(tmp_path, [".mp3"], debounce_seconds=0)
+
+    assert watcher.scan_due() is False
+
+    watcher._note(SimpleNamespace(src_path=str(tmp_path / "track.mp3"), is_directory=False))
+
+    assert watcher.scan_due() is True
+    assert watcher.scan_due() is False
+
+
+def test_mark_dirty_rearms_a_consumed_trigger(tmp_path):
+    watcher = MusicWatcher(tmp_path, [".mp3"], debounce_seconds=0)
+    watcher._note(SimpleNamespace(src_path=str(tmp_path / "track.mp3"), is_directory=False))
+
+    assert watcher.scan_due() is True
+
+    watcher.mark_dirty()
+
+    assert watcher.scan_due() is True
+
+
+def test_non_audio_and_directory_events_are_ignored(tmp_path):
+    watcher = MusicWatcher(tmp_path, [".mp3"], debounce_seconds=0)
+
+    watcher._note(SimpleNamespace(src_path=str(tmp_path / "cover.jpg"), is_directory=False))
+    watcher._note(SimpleNamespace(src_path=str(tmp_path / "album.mp3"), is_directory=True))
+
+    assert watcher.scan_due() is False